@@ -1,7 +1,9 @@
 #SQLAlchemy imports for database setup
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 
 
 # BASE_DIR points to backend/app no matter where you run the server from
@@ -13,11 +15,46 @@ SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
 #Engine = the core interface to the database
 #check_same_thread=False is required for SQLite with FastAPI
+#QueuePool keeps connections open between requests instead of reopening the file each time
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # needed for SQLite + FastAPI
+    connect_args={"check_same_thread": False},  # needed for SQLite + FastAPI
+    poolclass=QueuePool,
+    pool_size=20,          # connections kept open in the pool
+    max_overflow=10,       # extra connections allowed under burst load
+    pool_timeout=30,       # seconds to wait for a free connection before erroring
+    pool_pre_ping=True,    # drop dead connections before handing them out
+    pool_recycle=3600,     # reopen connections older than an hour
+    query_cache_size=1200, # compiled-statement cache entries (default is 500)
+    #Set TASKFLOW_SQL_ECHO=1 to log SQL; each statement shows
+    #"[cached since ...]" on a cache hit or "[generated in ...]" on a miss
+    echo=os.getenv("TASKFLOW_SQL_ECHO") == "1",
 )
 
+#Runs on every new raw SQLite connection the engine opens
+#WAL lets readers keep going while a write is in progress,
+#and synchronous=NORMAL means one fsync per commit instead of two
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped I/O
+    cursor.execute("PRAGMA cache_size=-65536")    # negative = KiB, so 64 MB page cache
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 #Base is the class all db models will inherit from
+
+#Refreshes SQLite's query-planner statistics (an incremental ANALYZE)
+#Long-lived pooled connections never trigger this on their own,
+#so main.py runs it periodically and once more on shutdown
+def optimize_database():
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA optimize")
+
+#Session for the current request, set by the middleware in main.py
+#Every dependency in the same request shares this one session (and connection)
+db_session: ContextVar[Session] = ContextVar("db_session")
@@ -1,11 +1,88 @@
+import asyncio
+import logging
+import anyio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routes import router
-from app.database import engine
+from app.database import SessionLocal, db_session, engine, optimize_database
 from app.models import Base
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="TaskFlow API")
+logger = logging.getLogger(__name__)
+
+#How often to refresh SQLite planner stats, in seconds
+OPTIMIZE_INTERVAL_SECONDS = 600
+
+
+def try_optimize_database():
+    #A failed PRAGMA optimize (e.g. "database is locked" while a writer holds
+    #the lock) is logged and skipped; the next run will try again
+    try:
+        optimize_database()
+    except Exception:
+        logger.exception("PRAGMA optimize failed")
+
+
+async def optimize_periodically():
+    #Run PRAGMA optimize every OPTIMIZE_INTERVAL_SECONDS in a worker thread
+    while True:
+        await asyncio.sleep(OPTIMIZE_INTERVAL_SECONDS)
+        await anyio.to_thread.run_sync(try_optimize_database)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    #Create tables once per startup instead of running DDL at import time
+    Base.metadata.create_all(bind=engine)
+    optimize_task = asyncio.create_task(optimize_periodically())
+    try:
+        yield
+    finally:
+        #Stop the background loop, then refresh stats one last time
+        #If the task already ended with an error, log it instead of failing shutdown
+        optimize_task.cancel()
+        try:
+            await optimize_task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("PRAGMA optimize background task failed")
+        try_optimize_database()
+
+
+class DBSessionMiddleware:
+    """
+    Opens one session per HTTP request and shares it through the db_session
+    ContextVar, so every dependency in the request reuses the same session
+    and connection.
+
+    Plain ASGI middleware rather than @app.middleware("http"), which wraps
+    every request in a task group and memory streams.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        #Lifespan and websocket events don't need a session
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        #Creating a session is cheap; no connection is checked out until it is used
+        db = SessionLocal()
+        token = db_session.set(db)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            db_session.reset(token)
+            db.close()
+
+#Default response class on purpose: routes with a response_model are serialized
+#straight to JSON bytes by Pydantic's Rust core (FastAPI 0.130+)
+app = FastAPI(title="TaskFlow API", lifespan=lifespan)
+
+app.add_middleware(DBSessionMiddleware)
 
 @app.get("/health")
 def health_check():
@@ -1,16 +1,50 @@
+from datetime import date
+
 #SQLAlchemy column and type imports
-from sqlalchemy import Column, String, Date
+from sqlalchemy import Column, String, Integer
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import relationship
 
 #Base comes from database.py
 from app.database import Base
 
+#Use this instead of relationship() for every relationship added to a model
+def strict_relationship(target, **kwargs):
+    """
+    relationship() that raises instead of lazy-loading with a SELECT.
+
+    Touching an unloaded relationship (e.g. while serializing a list of tasks)
+    raises an error instead of silently running one query per row (N+1).
+    Load what you need up front with .options(selectinload(Model.attr)).
+    """
+    kwargs.setdefault("lazy", "raise_on_sql")
+    return relationship(target, **kwargs)
+
+#Stores a date as an INTEGER day number instead of ISO-8601 text
+class OrdinalDate(TypeDecorator):
+    """
+    date <-> date.toordinal() (days since 0001-01-01, which is day 1).
+
+    Integers are smaller than 'YYYY-MM-DD' strings and compare natively,
+    and reading a row skips parsing a date string.
+    Existing text dates are converted by backend/scripts/migrate_due_date.py.
+    """
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return value.toordinal() if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return date.fromordinal(value) if value is not None else None
+
 #Task Table Defintion
 class Task(Base):
     __tablename__ = "task" #table name in SQLite
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(String, primary_key=True, index=True)  # uuid4().hex; older rows keep dashed 36-char IDs
     title = Column(String, nullable=False)
-    due_date = Column(Date, nullable=True)
+    due_date = Column(OrdinalDate, nullable=True)
     status = Column(String, default="pending")
 
     #Defines the database table - Each attribute = a column - This replaces TASKS = []
\ No newline at end of file
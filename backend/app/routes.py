@@ -4,8 +4,7 @@ routes.py
 This file defines the API routes for the TaskFlow service.
 It contains:
 - Data models (what a Task looks like)
-- API endpoints (how clients interact with Tasks)
-- Temporary in-memory storage (will later be replaced by a database)
+- API endpoints (how clients interact with Tasks, stored in SQLite)
 """
 
 from fastapi import HTTPException, Depends # add to imports at top (used for 404 errors)
@@ -16,27 +15,35 @@ from datetime import date
 from typing import List, Optional
 #uuid4 generates a universally unique Identifier, We use this to assign each task a unique ID 
 from uuid import uuid4
+#anyio runs blocking SQLite calls in a worker thread from async endpoints
+import anyio
 #APIRouter lets us group API endpoints together
 #This keeps routes separates from main.py and makes the app scalable
 from fastapi import APIRouter
+#Response lets create endpoints send already-validated data without re-validating it
+from fastapi import Response
+#orjson encodes those responses (handles date objects natively)
+import orjson
 #BaseModel is the foundation for request foundation for request/response validation
 #Field lets us add constraints (length, description, required fields)
 from pydantic import BaseModel, Field
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.database import db_session
 from app.models import Task as TaskModel
 
 
-def get_db():
+async def get_db():
     """
-    Creates a Database session per request.
-    Closes it after the request finishes.
+    Returns the Database session for the current request.
+
+    Async so FastAPI runs it on the event loop instead of dispatching
+    it to the threadpool on every request.
+
+    DBSessionMiddleware (main.py) opens the session and closes it when
+    the request finishes, so there is no cleanup here.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    return db_session.get()
 
 
 #APIRouter allows us to group related endpoints
@@ -77,21 +84,36 @@ class TaskUpdate(BaseModel):
     What the client is allowed to change on an existing task.
     Optional fields mean you can update only what you send.
     """
-    title: Optional[str] = None
+    title: Optional[str] = Field(None, min_length=1, max_length=200)  # same limits as TaskCreate
     due_date: Optional[date] = None
     status: Optional[str] = None  # allow status updates too
 
-#---------------------------
-# Temporary In-Memory Storage
-#--------------------------
-#This list simulates a database for now.
-# We will replace this with SQLite / Postgres later.
-TASKS: List[Task] = []
+# -----------------------
+# Prebuilt SQL Statements
+# -----------------------
+# Built once at import so every request reuses the same statement object
+# and hits SQLAlchemy's compiled-statement cache instead of rebuilding it.
+
+# Columns returned to the client (matches the Task schema)
+TASK_COLUMNS = (TaskModel.id, TaskModel.title, TaskModel.due_date, TaskModel.status)
+
+# All tasks
+LIST_TASKS = select(*TASK_COLUMNS)
 
+# One task by ID; pass {"task_id": ...} when executing
+GET_TASK_BY_ID = select(*TASK_COLUMNS).where(TaskModel.id == bindparam("task_id"))
+
+# -----------------------
+# Response Helpers
+# -----------------------
+
+def json_response(content):
+    """
+    JSON Response for data that was already validated on input.
 
-#-----------------------
-#API Endpoints
-#----------------------
+    FastAPI does not run response_model validation on a returned Response.
+    """
+    return Response(orjson.dumps(content), media_type="application/json")
 
 # -----------------------
 # API Endpoints (SQLite-backed)
@@ -106,46 +128,84 @@ def create_task(payload: TaskCreate, db: Session = Depends(get_db)):
     - db: database session injected per request
     """
 
-    # Create a new SQLAlchemy Task object (not yet saved)
-    task = TaskModel(
-        id=str(uuid4()),          # generate unique task ID
-        title=payload.title,      # task title from request
-        due_date=payload.due_date,
-        status="pending"          # default status
-    )
+    # Build the task row (values already validated by TaskCreate)
+    task = {
+        "id": uuid4().hex,            # generate unique task ID (32 hex chars, no dashes)
+        "title": payload.title,       # task title from request
+        "due_date": payload.due_date,
+        "status": "pending",          # default status
+    }
 
-    # Stage the object for insertion
-    db.add(task)
+    # Stage a SQLAlchemy Task object for insertion
+    db.add(TaskModel(**task))
 
     # Commit transaction (writes to database)
+    # No refresh needed: every column was set above
     db.commit()
 
-    # Refresh pulls DB-generated values back into the object
-    db.refresh(task)
+    # Every value came from the validated payload, so send it directly;
+    # returning a Response skips response_model validation (still used for the docs)
+    return json_response(task)
 
-    # Return the saved task (FastAPI converts to response_model)
-    return task
+@router.post("/tasks/bulk", response_model=List[Task])
+def create_tasks(payload: List[TaskCreate], db: Session = Depends(get_db)):
+    """
+    Create many tasks in one request.
+
+    All rows go in with a single executemany INSERT and one commit,
+    instead of one transaction per task.
+    """
+
+    # Build plain row dicts (no ORM objects needed)
+    rows = [
+        {
+            "id": uuid4().hex,
+            "title": task.title,
+            "due_date": task.due_date,
+            "status": "pending",
+        }
+        for task in payload
+    ]
+
+    # Nothing to insert
+    if not rows:
+        return json_response([])
+
+    # One INSERT statement executed for every row, then one commit
+    db.execute(insert(TaskModel), rows)
+    db.commit()
+
+    # Return the created tasks without re-validating them
+    return json_response(rows)
 
 @router.get("/tasks", response_model=List[Task])
-def list_tasks(db: Session = Depends(get_db)):
+async def list_tasks(db: Session = Depends(get_db)):
     """
     Retrieve all tasks from SQLite.
+
+    Async so the event loop stays free; only the query itself
+    runs in a worker thread.
     """
 
-    # Query all rows from the tasks table
-    tasks = db.query(TaskModel).all()
+    # Select only the columns we return; plain row mappings skip
+    # building ORM objects and the identity map for a read-only list
+    rows = await anyio.to_thread.run_sync(
+        lambda: db.execute(LIST_TASKS).mappings().all()
+    )
 
-    # Return list of TaskModel objects
-    return tasks
+    # Return list of row mappings (FastAPI validates against response_model)
+    return list(rows)
 
 @router.get("/tasks/{task_id}", response_model=Task)
-def get_task(task_id: str, db: Session = Depends(get_db)):
+async def get_task(task_id: str, db: Session = Depends(get_db)):
     """
     Retrieve a single task by its ID.
     """
 
-    # Look up task by primary key
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    # Look up task by primary key using the prebuilt statement (in a worker thread)
+    task = await anyio.to_thread.run_sync(
+        lambda: db.execute(GET_TASK_BY_ID, {"task_id": task_id}).mappings().one_or_none()
+    )
 
     # If no task exists, return HTTP 404
     if not task:
@@ -154,6 +214,26 @@ def get_task(task_id: str, db: Session = Depends(get_db)):
     # Return the found task
     return task
 
+def update_task_row(db: Session, task_id: str, values: dict):
+    """
+    Apply `values` to one task with a single UPDATE ... RETURNING.
+
+    Returns the updated row as a mapping, or None if no task has that ID.
+    Requires SQLite 3.35+ for RETURNING support.
+    """
+
+    stmt = (
+        update(TaskModel)
+        .where(TaskModel.id == task_id)
+        .values(**values)
+        .returning(*TASK_COLUMNS)
+    )
+
+    # Grab the row before commit so it is not expired along with the session
+    row = db.execute(stmt).mappings().one_or_none()
+    db.commit()
+    return row
+
 @router.put("/tasks/{task_id}", response_model=Task)
 def update_task(task_id: str, payload: TaskUpdate, db: Session = Depends(get_db)):
     """
@@ -162,29 +242,21 @@ def update_task(task_id: str, payload: TaskUpdate, db: Session = Depends(get_db)
     Only fields sent by the client will be updated.
     """
 
-    # Fetch task from database
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    # Keep only the fields that were provided
+    values = payload.model_dump(exclude_none=True)
+
+    # Nothing to change, just read the current task
+    if not values:
+        task = db.execute(GET_TASK_BY_ID, {"task_id": task_id}).mappings().one_or_none()
+    else:
+        # Update and read back the task in one statement
+        task = update_task_row(db, task_id, values)
 
     # If task doesn't exist, return 404
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Update fields only if provided
-    if payload.title is not None:
-        task.title = payload.title
-
-    if payload.due_date is not None:
-        task.due_date = payload.due_date
-
-    if payload.status is not None:
-        task.status = payload.status
-
-    # Persist changes
-    db.commit()
-
-    # Refresh to ensure updated values are returned
-    db.refresh(task)
-
+    # Return the updated row (FastAPI validates against response_model)
     return task
 
 @router.post("/tasks/{task_id}/complete", response_model=Task)
@@ -193,22 +265,14 @@ def complete_task(task_id: str, db: Session = Depends(get_db)):
     Mark a task as completed.
     """
 
-    # Fetch task from database
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    # Set status and read back the task in one statement
+    task = update_task_row(db, task_id, {"status": "completed"})
 
     # If task doesn't exist, return 404
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Update status field
-    task.status = "completed"
-
-    # Commit change
-    db.commit()
-
-    # Refresh updated task
-    db.refresh(task)
-
+    # Return the updated row (FastAPI validates against response_model)
     return task
 
 @router.delete("/tasks/{task_id}")
@@ -218,7 +282,7 @@ def delete_task(task_id: str, db: Session = Depends(get_db)):
     """
 
     # Fetch task
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    task = db.get(TaskModel, task_id)
 
     # Return 404 if task not found
     if not task:
@@ -0,0 +1,48 @@
+"""
+migrate_due_date.py
+
+One-time migration for the due_date storage change.
+due_date used to be stored as ISO-8601 text ('YYYY-MM-DD');
+it is now an INTEGER day number (date.toordinal()).
+
+Safe to run more than once: only rows still holding text are converted.
+
+Usage (from backend/):
+    python scripts/migrate_due_date.py [path/to/taskflow.db]
+"""
+
+import os
+import sqlite3
+import sys
+from datetime import date
+
+#Default to the same database file the app uses (backend/app/taskflow.db)
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "taskflow.db"
+)
+
+
+def migrate(db_path):
+    """
+    Convert every text due_date in the task table to its ordinal day number.
+    Returns the number of rows updated.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT id, due_date FROM task WHERE typeof(due_date) = 'text'"
+        ).fetchall()
+
+        conn.executemany(
+            "UPDATE task SET due_date = ? WHERE id = ?",
+            [(date.fromisoformat(due_date).toordinal(), task_id) for task_id, due_date in rows],
+        )
+        conn.commit()
+        return len(rows)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_PATH
+    print(f"Converted {migrate(path)} due_date value(s) in {path}")